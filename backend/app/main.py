@@ -4,32 +4,126 @@ import logging
 import os
 
 import io
-import uuid
+import itertools
+import time
 from typing import Optional, List
 
 from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, FileResponse, Response
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from PIL import Image
+import orjson
+from PIL import ExifTags, Image, ImageOps
 
 from .schemas import ClassifyResponse, ErrorBody, LabelScore
-from .vision_provider import get_provider
+from .vision_provider import close_openai_client, get_provider
 from .rules import decide_bin_from_profile, apply_clarification
 
 
 MAX_BYTES = 8 * 1024 * 1024  # 8MB
-ALLOWED_MIME = {"image/jpeg", "image/png"}  # Stage 1 Phase 1: JPG/PNG support
+ALLOWED_MIME = frozenset({"image/jpeg", "image/png"})  # Stage 1 Phase 1: JPG/PNG support
+# Whole-request cap checked against Content-Length; leaves room for multipart framing and form fields
+MAX_REQUEST_BYTES = MAX_BYTES + 64 * 1024
+# JPEG re-encode settings. Huffman optimization and progressive scans cost several
+# times the baseline encode for a few % smaller output, so both are opt-in.
+JPEG_QUALITY = int(os.getenv("JPEG_QUALITY", "85"))
+JPEG_OPTIMIZE = os.getenv("JPEG_OPTIMIZE", "0") == "1"
+JPEG_PROGRESSIVE = os.getenv("JPEG_PROGRESSIVE", "0") == "1"
+# Longest edge sent to the vision provider; providers downsample larger images anyway
+MAX_DIM = int(os.getenv("MAX_DIM", "1568"))
+# JPEG uploads up to this size that need no changes are forwarded without re-encoding (0 disables)
+NORMALIZE_SKIP_BYTES = int(os.getenv("NORMALIZE_SKIP_BYTES", "512000"))
+# Image.info keys that may be forwarded untouched; anything else (EXIF, XMP,
+# Photoshop/IPTC, comments, ...) forces a re-encode, which writes none of them
+_FORWARDABLE_INFO_KEYS = frozenset({
+    "jfif", "jfif_version", "jfif_unit", "jfif_density", "icc_profile",
+    "dpi", "adobe", "adobe_transform", "progressive", "progression",
+})
+# Pillow leaves unrecognised segments (APP3, APP11 JUMBF/C2PA, APP12, extended XMP,
+# COM, ...) out of Image.info and only lists them in Image.applist, so the skip path
+# also requires every segment to be one of these, identified by its payload prefix
+_FORWARDABLE_SEGMENTS = {"APP0": b"JFIF\x00", "APP2": b"ICC_PROFILE\x00", "APP14": b"Adobe"}
+
+
+def _has_only_forwardable_segments(im: Image.Image) -> bool:
+    for marker, data in im.applist:
+        prefix = _FORWARDABLE_SEGMENTS.get(marker)
+        if prefix is None or not data.startswith(prefix):
+            return False
+    return True
+
+# Request IDs only need to be unique for tracing, not unpredictable: a per-process
+# counter prefixed with start time and pid avoids a urandom read per request.
+# Format: req_<start>-<pid>-<seq>, all hex; the separators keep the parts unambiguous.
+def _reset_request_ids() -> None:
+    global _RID_PREFIX, _RID_SEQ
+    _RID_PREFIX = f"req_{int(time.time()):x}-{os.getpid():x}-"
+    _RID_SEQ = itertools.count()
+
+
+_reset_request_ids()
+if hasattr(os, "register_at_fork"):
+    # Workers forked after import (e.g. gunicorn --preload) get their own prefix and counter
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+def _new_request_id() -> str:
+    return f"{_RID_PREFIX}{next(_RID_SEQ):x}"
+
+
+app = FastAPI(title="Waste Classification API", version="1.0.0", default_response_class=ORJSONResponse)
+logger = logging.getLogger("waste_app")
 
 
-app = FastAPI(title="Waste Classification API", version="1.0.0")
-logger = logging.getLogger("waste_app")
+class RequestIDMiddleware(BaseHTTPMiddleware):
+    """Middleware to generate and store request_id in request.state for tracing."""
+    async def dispatch(self, request: Request, call_next):
+        # OPTIONS carries no work worth tracing; error bodies fall back to a fresh ID
+        if request.method == "OPTIONS":
+            return await call_next(request)
+        request.state.request_id = _new_request_id()
+        response = await call_next(request)
+        return response
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Rejects requests whose declared Content-Length exceeds MAX_REQUEST_BYTES.
+    FastAPI parses (and spools) the multipart body before the endpoint runs, so
+    this has to happen before routing to avoid receiving oversized uploads.
+    Plain ASGI rather than BaseHTTPMiddleware: only the headers are needed, so
+    requests skip the extra task group and response-streaming wrapper.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_REQUEST_BYTES:
+                        # request.state is backed by scope["state"], set by RequestIDMiddleware
+                        request_id = scope.get("state", {}).get("request_id")
+                        body = _error_body(f"File too large. Max {MAX_BYTES // (1024*1024)} MB.", 413, "http_error", request_id=request_id)
+                        await ORJSONResponse(status_code=413, content=body)(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+# Add request ID and size-limit middleware. Starlette runs the last-added middleware
+# first, so both are registered before CORS: CORS preflights are answered without
+# entering them, and the size check runs with request_id already set.
+app.add_middleware(RequestSizeLimitMiddleware)
+app.add_middleware(RequestIDMiddleware)
 
 # Configure CORS to allow mobile app requests
 # Allow all origins by default for mobile app development
@@ -56,20 +150,31 @@ app.add_middleware(
 # Mount static files from web directory
 # Directory structure: backend/app/main.py -> parents[2] -> project root -> web/
 WEB_DIR = Path(__file__).resolve().parents[2] / "web"
-if WEB_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(WEB_DIR)), name="static")
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and store request_id in request.state for tracing."""
-    async def dispatch(self, request: Request, call_next):
-        request.state.request_id = f"req_{uuid.uuid4().hex[:12]}"
-        response = await call_next(request)
+def _cache_control_for(filename: str) -> str:
+    """
+    Icons never change in place, so browsers may keep them for a year.
+    Everything else (index.html, manifest, service worker) is not fingerprinted
+    and must revalidate, which is a cheap 304 thanks to StaticFiles' ETags.
+    """
+    if filename.startswith("icon-"):
+        return "public, max-age=31536000, immutable"
+    return "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that stamps a Cache-Control header on every file response."""
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = _cache_control_for(os.path.basename(full_path))
         return response
 
 
-# Add request ID middleware
-app.add_middleware(RequestIDMiddleware)
+if WEB_DIR.exists():
+    app.mount("/static", CachedStaticFiles(directory=str(WEB_DIR)), name="static")
+
+
 
 @app.on_event("startup")
 def log_provider_config() -> None:
@@ -79,6 +184,11 @@ def log_provider_config() -> None:
         logger.info("OPENAI_MODEL=%s", os.getenv("OPENAI_MODEL", "unset"))
 
 
+@app.on_event("shutdown")
+async def close_vision_client() -> None:
+    await close_openai_client()
+
+
 def _error_body(message: str, status_code: int, error_type: str, request_id: Optional[str] = None, details: Optional[dict] = None) -> dict:
     """
     Generate error response body with request_id from request state if available.
@@ -91,7 +201,7 @@ def _error_body(message: str, status_code: int, error_type: str, request_id: Opt
         details: Optional error details dictionary
     """
     body = {
-        "request_id": request_id or f"req_{uuid.uuid4().hex[:12]}",
+        "request_id": request_id or _new_request_id(),
         "error": {
             "message": message,
             "code": status_code,
@@ -103,66 +213,32 @@ def _error_body(message: str, status_code: int, error_type: str, request_id: Opt
     return body
 
 
+# Same shape as _error_body(); only the (JSON-encoded) request_id varies
+_INTERNAL_ERROR_TEMPLATE = (
+    b'{"request_id":%s,"error":{"message":"Internal server error","code":500,"type":"internal_error"}}'
+)
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     request_id = getattr(request.state, "request_id", None)
     body = _error_body(str(exc.detail), exc.status_code, "http_error", request_id=request_id)
-    return JSONResponse(status_code=exc.status_code, content=body)
+    return ORJSONResponse(status_code=exc.status_code, content=body)
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     request_id = getattr(request.state, "request_id", None)
     body = _error_body("Validation error", 422, "validation_error", request_id=request_id, details={"errors": jsonable_encoder(exc.errors())})
-    return JSONResponse(status_code=422, content=body)
+    return ORJSONResponse(status_code=422, content=body)
 
 
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     request_id = getattr(request.state, "request_id", None)
     logger.exception("Unhandled exception", extra={"request_id": request_id})
-    body = _error_body("Internal server error", 500, "internal_error", request_id=request_id)
-    return JSONResponse(status_code=500, content=body)
-
-
-@app.get("/")
-async def root():
-    """Serve the index.html from the web directory."""
-    index_path = WEB_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    raise HTTPException(status_code=404, detail="Frontend index.html file not found. Ensure the web directory exists at the project root.")
-
-
-@app.get("/manifest.json")
-async def manifest():
-    """Serve the PWA manifest file."""
-    manifest_path = WEB_DIR / "manifest.json"
-    if manifest_path.exists():
-        return FileResponse(manifest_path, media_type="application/json")
-    raise HTTPException(status_code=404, detail="manifest.json not found")
-
-
-@app.get("/sw.js")
-async def service_worker():
-    """Serve the service worker file."""
-    sw_path = WEB_DIR / "sw.js"
-    if sw_path.exists():
-        return FileResponse(sw_path, media_type="application/javascript")
-    raise HTTPException(status_code=404, detail="sw.js not found")
-
-
-@app.get("/icon-{size}.png")
-async def icon(size: str):
-    """Serve PWA icons."""
-    # Validate size parameter to prevent path traversal
-    if size not in ["192", "512"]:
-        raise HTTPException(status_code=404, detail="Icon size not found")
-    
-    icon_path = WEB_DIR / f"icon-{size}.png"
-    if icon_path.exists():
-        return FileResponse(icon_path, media_type="image/png")
-    raise HTTPException(status_code=404, detail=f"icon-{size}.png not found")
+    content = _INTERNAL_ERROR_TEMPLATE % orjson.dumps(request_id or _new_request_id())
+    return Response(content=content, status_code=500, media_type="application/json")
 
 
 @app.get("/favicon.ico")
@@ -178,14 +254,55 @@ def health():
 
 def _normalize_image(image_bytes: bytes, mime: str) -> bytes:
     """
-    Decode and re-encode to JPEG to normalize and strip EXIF by default.
+    Decode and re-encode to JPEG to normalize and strip EXIF by default
+    (after applying its orientation). Images larger than MAX_DIM on either
+    edge are downscaled first.
+    Small RGB JPEGs that carry no metadata and fit within MAX_DIM are returned
+    as-is after a cheap 1/8-scale validation decode, skipping the full
+    decode/encode.
     Stage 1 Phase 1 implementation.
     """
     try:
         with Image.open(io.BytesIO(image_bytes)) as im:
-            im = im.convert("RGB")
+            if (
+                mime == "image/jpeg"
+                and len(image_bytes) <= NORMALIZE_SKIP_BYTES
+                and im.format == "JPEG"
+                and im.mode == "RGB"
+                and max(im.size) <= MAX_DIM
+                and im.info.keys() <= _FORWARDABLE_INFO_KEYS
+                and _has_only_forwardable_segments(im)
+            ):
+                # Image.open only read the headers; decode at 1/8 scale so truncated or
+                # corrupt data is still rejected before it is forwarded.
+                im.draft("RGB", (max(1, im.width // 8), max(1, im.height // 8)))
+                im.load()
+                return image_bytes
+
+            if im.format == "JPEG" and max(im.size) > MAX_DIM:
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale via DCT scaling (never
+                # below the target size); thumbnail() below does the final resize.
+                scale = MAX_DIM / max(im.size)
+                im.draft("RGB", (round(im.width * scale), round(im.height * scale)))
+            # Re-encoding drops EXIF, so bake its orientation into the pixels. Only
+            # rotated uploads pay for the transpose, done after the downscale so it
+            # touches fewer pixels.
+            orientation = im.getexif().get(ExifTags.Base.Orientation, 1)
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            im.thumbnail((MAX_DIM, MAX_DIM), Image.Resampling.BILINEAR)
+            if orientation != 1:
+                im = ImageOps.exif_transpose(im)
             out = io.BytesIO()
-            im.save(out, format="JPEG", quality=90, optimize=True)
+            im.save(
+                out,
+                format="JPEG",
+                quality=JPEG_QUALITY,
+                subsampling=2,  # 4:2:0
+                optimize=JPEG_OPTIMIZE,
+                progressive=JPEG_PROGRESSIVE,
+                comment=b"",  # Pillow otherwise copies the upload's COM segment from im.info
+            )
             return out.getvalue()
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid image: {e}")
@@ -199,16 +316,24 @@ async def classify(
     client_request_id: Optional[str] = Form(None),
     locale: Optional[str] = Form(None),
 ):
-    request_id = getattr(request.state, "request_id", f"req_{uuid.uuid4().hex[:12]}")
+    request_id = getattr(request.state, "request_id", None) or _new_request_id()
 
     if image.content_type not in ALLOWED_MIME:
         raise HTTPException(status_code=415, detail=f"Unsupported media type: {image.content_type}. Use JPG or PNG.")
 
-    raw = await image.read()
+    # The multipart parser has already spooled the part to a temporary file; reject
+    # oversized parts by their recorded size and never read more than MAX_BYTES + 1
+    # bytes into memory.
+    too_large = f"File too large. Max {MAX_BYTES // (1024*1024)} MB."
+    if image.size is not None and image.size > MAX_BYTES:
+        raise HTTPException(status_code=413, detail=too_large)
+    raw = await image.read(MAX_BYTES + 1)
     if len(raw) > MAX_BYTES:
-        raise HTTPException(status_code=413, detail=f"File too large. Max {MAX_BYTES // (1024*1024)} MB.")
+        raise HTTPException(status_code=413, detail=too_large)
 
-    normalized = _normalize_image(raw, image.content_type)
+    # Decode/encode is CPU-bound; Pillow releases the GIL inside libjpeg, so run it
+    # in the threadpool to keep the event loop free for concurrent requests.
+    normalized = await run_in_threadpool(_normalize_image, raw, image.content_type)
 
     provider = get_provider()
     try:
@@ -243,7 +368,7 @@ class ClarifyRequest(BaseModel):
 @app.post("/v1/clarify", response_model=ClassifyResponse, responses={400: {"model": ErrorBody}})
 def clarify(request: Request, payload: ClarifyRequest):
     # Use request_id from payload if provided, otherwise use the one from request.state
-    request_id = payload.request_id or getattr(request.state, "request_id", f"req_{uuid.uuid4().hex[:12]}")
+    request_id = payload.request_id or getattr(request.state, "request_id", None) or _new_request_id()
     jurisdiction_id = "CA_DEFAULT"
 
     prior = payload.top_labels or []
@@ -257,3 +382,12 @@ def clarify(request: Request, payload: ClarifyRequest):
         clarification=None,
         special_handling=None
     )
+
+
+# Serve index.html, manifest.json, sw.js and icons from the web root. Each path is
+# routed to the StaticFiles app explicitly: a catch-all "/" mount would fully match
+# every path, so wrong-method API requests (GET /v1/classify) got 404 instead of 405.
+if WEB_DIR.exists():
+    _web_files = CachedStaticFiles(directory=str(WEB_DIR), html=True)
+    for _web_path in ("/", "/index.html", "/manifest.json", "/sw.js", "/icon-{size}.png", "/icon-{size}.svg"):
+        app.add_route(_web_path, _web_files, include_in_schema=False)
@@ -1,17 +1,153 @@
 from __future__ import annotations
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from .schemas import (
-    Result, RationaleItem, LabelScore, SpecialHandling, Clarification, ItemProfile
+    BinType, Result, RationaleItem, LabelScore, SpecialHandling, Clarification, ItemProfile
 )
 
+# Inputs (ItemProfile, LabelScore) are validated at the API boundary. Everything the
+# rules emit is built from those values and module constants, so outputs use
+# model_construct and skip re-validation.
+
+
+# Profile attribute lookups for decide_bin_from_profile
+_SPECIAL_CATEGORY_MAP = {
+    "battery": "BATTERY",
+    "e_waste": "E_WASTE",
+    "hhw": "HHW",
+    "sharps": "SHARPS"
+}
+_SPECIAL_INSTRUCTIONS_MAP = {
+    "battery": "Do not place in curbside bins. Take to a household hazardous waste drop-off or a retailer collection point.",
+    "e_waste": "Do not place in curbside bins. Take to an e-waste collection facility or retailer drop-off.",
+    "hhw": "Do not place in curbside bins. Take to a household hazardous waste collection facility.",
+    "sharps": "Do not place in curbside bins. Use a sharps container and take to a designated collection site."
+}
+_RECYCLABLE_MATERIALS = frozenset({"paper_cardboard", "metal", "glass", "rigid_plastic"})
+_CONTAMINATED_RISKS = frozenset({"medium", "high"})
+
+# Label groups for the legacy label-based rules (decide_bin_from_labels)
+_BATTERY_LABELS = frozenset({"battery"})
+_ORGANIC_LABELS = frozenset({"banana peel", "food"})
+_RECYCLABLE_LABELS = frozenset({"plastic bottle", "aluminum can", "glass bottle"})
+_FILM_LABELS = frozenset({"plastic bag"})
+_AMBIGUOUS_PAPER_LABELS = frozenset({"paper box"})
+_LABEL_TO_RULE = {
+    **dict.fromkeys(_BATTERY_LABELS, "BATTERY"),
+    **dict.fromkeys(_ORGANIC_LABELS, "ORGANIC"),
+    **dict.fromkeys(_RECYCLABLE_LABELS, "RECYCLABLE"),
+    **dict.fromkeys(_FILM_LABELS, "FILM"),
+    **dict.fromkeys(_AMBIGUOUS_PAPER_LABELS, "AMBIGUOUS_PAPER"),
+}
+
+# Clarification questions are constant; build them once and share the instances
+_YES_NO_OPTIONS = [{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
+_CLARIF_FOOD_SOILED = Clarification.model_construct(
+    question_id="q_food_soiled_01",
+    question_text="Is it food-soiled (grease/food residue)?",
+    answer_type="BOOLEAN",
+    options=_YES_NO_OPTIONS
+)
+_CLARIF_UNKNOWN = Clarification.model_construct(
+    question_id="q_unknown_01",
+    question_text="I'm not confident. Is the item mostly food/plant-based?",
+    answer_type="BOOLEAN",
+    options=_YES_NO_OPTIONS
+)
+_CLARIF_TRY_AGAIN = Clarification.model_construct(
+    question_id="q_try_again_01",
+    question_text="Could you retake the photo with one item and better lighting?",
+    answer_type="BOOLEAN",
+    options=[{"value": True, "label": "OK"}],
+)
+
+# Shared rationale items; RationaleItem is frozen so one instance can back every Result.
+_RI_ORGANIC_MATERIAL = RationaleItem(type="RULE", text="Organic materials go in organics")
+_RI_ORGANIC_FOOD = RationaleItem(type="RULE", text="Food and food scraps go in organics")
+_RI_RIGID_CONTAINER = RationaleItem(type="RULE", text="Rigid containers like bottles/cans typically go in recycling")
+_RI_FILM = RationaleItem(type="RULE", text="Plastic film/bags are usually not accepted in curbside recycling")
+_RI_PAPER_AMBIGUOUS = RationaleItem(type="RULE", text="Paper can be recycling if clean; organics/trash if food-soiled")
+_RI_PAPER_SOILED = RationaleItem(type="RULE", text="Food-soiled paper goes in organics (where accepted)")
+_RI_PAPER_MEDIUM = RationaleItem(type="RULE", text="Moderately soiled paper typically goes in organics")
+_RI_PAPER_CLEAN = RationaleItem(type="RULE", text="Clean paper/cardboard typically goes in recycling")
+_RI_CLEAN_RECYCLABLE = RationaleItem(type="RULE", text="Clean recyclable materials go in recycling")
+_RI_CONTAMINATED = RationaleItem(type="RULE", text="Contaminated recyclables typically go in trash")
+_RI_BATTERY = RationaleItem(type="SAFETY", text="Batteries require special disposal")
+_RI_FALLBACK = RationaleItem(type="SYSTEM", text="Falling back to clarification for safety")
+_RI_UNDETERMINED = RationaleItem(type="SYSTEM", text="Unable to determine classification")
+_RI_NO_LABELS = RationaleItem(type="SYSTEM", text="No labels returned")
+_RI_HEURISTIC_ANSWER = RationaleItem(type="RULE", text="Heuristic decision based on your answer")
+_RI_UNKNOWN_QUESTION = RationaleItem(type="SYSTEM", text="Unknown clarification question")
+
+_SPECIAL_BATTERY = SpecialHandling.model_construct(
+    category="BATTERY",
+    instructions=_SPECIAL_INSTRUCTIONS_MAP["battery"],
+    links=[]
+)
+
+# Material rules for decide_bin_from_profile, keyed by (material, contamination_risk);
+# "*" matches any contamination. Each rule is (bin, bin_label, rationale, clarification).
+_ProfileRule = Tuple[BinType, str, RationaleItem, Optional[Clarification]]
+
+_PROFILE_RULES: Dict[Tuple[str, str], _ProfileRule] = {
+    # 2. Organics
+    ("organic", "*"): ("GREEN", "Organics", _RI_ORGANIC_MATERIAL, None),
+    # 4. Film plastic → trash (typically not accepted curbside)
+    ("film_plastic", "*"): ("GRAY", "Landfill (Trash)", _RI_FILM, None),
+    # 5. Paper/cardboard with unknown contamination → ask clarification
+    ("paper_cardboard", "unknown"): ("UNKNOWN", "Not sure yet", _RI_PAPER_AMBIGUOUS, _CLARIF_FOOD_SOILED),
+    # 6. Paper/cardboard with high contamination → organics (where accepted)
+    ("paper_cardboard", "high"): ("GREEN", "Organics", _RI_PAPER_SOILED, None),
+    # 7. Paper/cardboard with medium contamination → organics
+    ("paper_cardboard", "medium"): ("GREEN", "Organics", _RI_PAPER_MEDIUM, None),
+}
+for _material in _RECYCLABLE_MATERIALS:
+    # 3. Clear recycling: clean rigid containers
+    _PROFILE_RULES[(_material, "low")] = ("BLUE", "Recycling", _RI_CLEAN_RECYCLABLE, None)
+    # 8. Recyclable materials with contamination → trash (paper is handled above)
+    for _risk in _CONTAMINATED_RISKS:
+        _PROFILE_RULES.setdefault((_material, _risk), ("GRAY", "Landfill (Trash)", _RI_CONTAMINATED, None))
+del _material, _risk
+
+_RULE_UNKNOWN_ITEM: _ProfileRule = ("UNKNOWN", "Not sure yet", _RI_FALLBACK, _CLARIF_UNKNOWN)
+_RULE_UNDETERMINED: _ProfileRule = ("UNKNOWN", "Not sure yet", _RI_UNDETERMINED, _CLARIF_UNKNOWN)
+
+# Answers to clarification questions, keyed by (question_id, answer).
+# Each rule is (bin, bin_label, confidence_score, rationale).
+_ClarificationRule = Tuple[BinType, str, float, RationaleItem]
+
+_CLARIFICATION_RULES: Dict[Tuple[str, bool], _ClarificationRule] = {
+    ("q_food_soiled_01", True): ("GREEN", "Organics", 0.70, _RI_PAPER_SOILED),
+    ("q_food_soiled_01", False): ("BLUE", "Recycling", 0.70, _RI_PAPER_CLEAN),
+    ("q_unknown_01", True): ("GREEN", "Organics", 0.55, _RI_HEURISTIC_ANSWER),
+    ("q_unknown_01", False): ("GRAY", "Landfill (Trash)", 0.55, _RI_HEURISTIC_ANSWER),
+}
+_CLARIFICATION_UNKNOWN_QUESTION: _ClarificationRule = ("UNKNOWN", "Not sure yet", 0.0, _RI_UNKNOWN_QUESTION)
+
+
+_CONFIDENCE_BUCKETS = ("LOW", "MEDIUM", "HIGH")
+
 
 def _confidence_bucket(score: float) -> str:
-    if score >= 0.85:
-        return "HIGH"
-    if score >= 0.65:
-        return "MEDIUM"
-    return "LOW"
+    # LOW below 0.65, MEDIUM below 0.85, HIGH otherwise
+    return _CONFIDENCE_BUCKETS[(score >= 0.65) + (score >= 0.85)]
+
+
+def _make_result(bin_type: BinType, bin_label: str, score: float, rationale: List[RationaleItem], top_labels: List[LabelScore]) -> Result:
+    return Result.model_construct(
+        bin=bin_type,
+        bin_label=bin_label,
+        confidence=_confidence_bucket(score),
+        confidence_score=float(score),
+        rationale=rationale,
+        top_labels=top_labels
+    )
+
+
+def _top_labels_key(labels: List[LabelScore]) -> Tuple[LabelScore, ...]:
+    """Top five labels as a hashable tuple, without an intermediate slice for short lists."""
+    return tuple(labels) if len(labels) <= 5 else tuple(labels[:5])
 
 
 def decide_bin_from_profile(
@@ -21,179 +157,63 @@ def decide_bin_from_profile(
     """
     Decision table-based rules operating on ItemProfile.
     Scales because it operates on classes, not specific label instances.
+
+    Results are memoized on the profile's attributes, so the returned objects
+    are shared between calls and must not be mutated.
     """
-    rationale: List[RationaleItem] = []
-    
     # Store raw labels for debugging if available
-    top_labels = profile.raw_labels[:5] if profile.raw_labels else []
-    
+    top_labels = _top_labels_key(profile.raw_labels) if profile.raw_labels else ()
+    return _decide_bin_from_profile(
+        profile.material,
+        profile.form_factor,
+        profile.contamination_risk,
+        profile.special_handling,
+        profile.confidence,
+        top_labels,
+        jurisdiction_id,
+    )
+
+
+@lru_cache(maxsize=512)
+def _decide_bin_from_profile(
+    material: str,
+    form_factor: str,
+    contamination_risk: str,
+    special_handling: str,
+    confidence: float,
+    raw_top_labels: Tuple[LabelScore, ...],
+    jurisdiction_id: str,
+) -> Tuple[Result, bool, Optional[Clarification], Optional[SpecialHandling]]:
+    top_labels = list(raw_top_labels)
+
     # Build rationale from profile
-    rationale.append(RationaleItem(
+    rationale: List[RationaleItem] = [RationaleItem(
         type="DETECTED_ITEM",
-        text=f"Material: {profile.material}, Form: {profile.form_factor}, Contamination: {profile.contamination_risk}"
-    ))
-
-    # Decision Table Logic (order matters)
+        text=f"Material: {material}, Form: {form_factor}, Contamination: {contamination_risk}"
+    )]
 
     # 1. Special handling first
-    if profile.special_handling != "none":
-        special_category_map = {
-            "battery": "BATTERY",
-            "e_waste": "E_WASTE",
-            "hhw": "HHW",
-            "sharps": "SHARPS"
-        }
-        category = special_category_map.get(profile.special_handling, "UNKNOWN")
-        
-        instructions_map = {
-            "battery": "Do not place in curbside bins. Take to a household hazardous waste drop-off or a retailer collection point.",
-            "e_waste": "Do not place in curbside bins. Take to an e-waste collection facility or retailer drop-off.",
-            "hhw": "Do not place in curbside bins. Take to a household hazardous waste collection facility.",
-            "sharps": "Do not place in curbside bins. Use a sharps container and take to a designated collection site."
-        }
-        instructions = instructions_map.get(profile.special_handling, "Requires special disposal. Check local guidelines.")
-        
-        special = SpecialHandling(
-            category=category,
-            instructions=instructions,
+    if special_handling != "none":
+        special = SpecialHandling.model_construct(
+            category=_SPECIAL_CATEGORY_MAP.get(special_handling, "UNKNOWN"),
+            instructions=_SPECIAL_INSTRUCTIONS_MAP.get(special_handling, "Requires special disposal. Check local guidelines."),
             links=[]
         )
-        res = Result(
-            bin="SPECIAL",
-            bin_label="Special handling",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="SAFETY", text=f"{profile.special_handling.replace('_', ' ').title()} requires special disposal")],
-            top_labels=top_labels
-        )
+        safety = RationaleItem(type="SAFETY", text=f"{special_handling.replace('_', ' ').title()} requires special disposal")
+        rationale.append(safety)
+        res = _make_result("SPECIAL", "Special handling", confidence, rationale, top_labels)
         return res, False, None, special
 
-    # 2. Organics
-    if profile.material == "organic":
-        res = Result(
-            bin="GREEN",
-            bin_label="Organics",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Organic materials go in organics")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
+    # 2.-8. Material rules: exact (material, contamination) match, then any contamination
+    rule = _PROFILE_RULES.get((material, contamination_risk)) or _PROFILE_RULES.get((material, "*"))
+    if rule is None:
+        # 9. Unknown material or form factor, 10. default fallback → clarification
+        rule = _RULE_UNKNOWN_ITEM if material == "unknown" or form_factor == "unknown" else _RULE_UNDETERMINED
 
-    # 3. Clear recycling: clean rigid containers
-    recyclable_materials = {"paper_cardboard", "metal", "glass", "rigid_plastic"}
-    if profile.material in recyclable_materials and profile.contamination_risk == "low":
-        res = Result(
-            bin="BLUE",
-            bin_label="Recycling",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Clean recyclable materials go in recycling")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
-
-    # 4. Film plastic → trash (typically not accepted curbside)
-    if profile.material == "film_plastic":
-        res = Result(
-            bin="GRAY",
-            bin_label="Landfill (Trash)",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Plastic film/bags are usually not accepted in curbside recycling")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
-
-    # 5. Paper/cardboard with unknown contamination → ask clarification
-    if profile.material == "paper_cardboard" and profile.contamination_risk == "unknown":
-        clarification = Clarification(
-            question_id="q_food_soiled_01",
-            question_text="Is it food-soiled (grease/food residue)?",
-            answer_type="BOOLEAN",
-            options=[{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
-        )
-        res = Result(
-            bin="UNKNOWN",
-            bin_label="Not sure yet",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Paper can be recycling if clean; organics/trash if food-soiled")],
-            top_labels=top_labels
-        )
-        return res, True, clarification, None
-
-    # 6. Paper/cardboard with high contamination → organics or trash (policy-dependent)
-    if profile.material == "paper_cardboard" and profile.contamination_risk == "high":
-        # Default to organics where accepted, otherwise trash
-        res = Result(
-            bin="GREEN",
-            bin_label="Organics",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Food-soiled paper goes in organics (where accepted)")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
-
-    # 7. Paper/cardboard with medium contamination → ask or default to organics
-    if profile.material == "paper_cardboard" and profile.contamination_risk == "medium":
-        res = Result(
-            bin="GREEN",
-            bin_label="Organics",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Moderately soiled paper typically goes in organics")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
-
-    # 8. Recyclable materials with contamination → trash
-    if profile.material in recyclable_materials and profile.contamination_risk in {"medium", "high"}:
-        res = Result(
-            bin="GRAY",
-            bin_label="Landfill (Trash)",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="RULE", text="Contaminated recyclables typically go in trash")],
-            top_labels=top_labels
-        )
-        return res, False, None, None
-
-    # 9. Unknown material or form factor → clarification
-    if profile.material == "unknown" or profile.form_factor == "unknown":
-        clarification = Clarification(
-            question_id="q_unknown_01",
-            question_text="I'm not confident. Is the item mostly food/plant-based?",
-            answer_type="BOOLEAN",
-            options=[{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
-        )
-        res = Result(
-            bin="UNKNOWN",
-            bin_label="Not sure yet",
-            confidence=_confidence_bucket(profile.confidence),
-            confidence_score=float(profile.confidence),
-            rationale=rationale + [RationaleItem(type="SYSTEM", text="Falling back to clarification for safety")],
-            top_labels=top_labels
-        )
-        return res, True, clarification, None
-
-    # 10. Default fallback
-    clarification = Clarification(
-        question_id="q_unknown_01",
-        question_text="I'm not confident. Is the item mostly food/plant-based?",
-        answer_type="BOOLEAN",
-        options=[{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
-    )
-    res = Result(
-        bin="UNKNOWN",
-        bin_label="Not sure yet",
-        confidence=_confidence_bucket(profile.confidence),
-        confidence_score=float(profile.confidence),
-        rationale=rationale + [RationaleItem(type="SYSTEM", text="Unable to determine classification")],
-        top_labels=top_labels
-    )
-    return res, True, clarification, None
+    bin_type, bin_label, rule_rationale, clarification = rule
+    rationale.append(rule_rationale)
+    res = _make_result(bin_type, bin_label, confidence, rationale, top_labels)
+    return res, clarification is not None, clarification, None
 
 
 def decide_bin_from_labels(
@@ -204,160 +224,67 @@ def decide_bin_from_labels(
     DEPRECATED: Legacy function kept for backward compatibility.
     Use decide_bin_from_profile instead.
     """
-    rationale: List[RationaleItem] = []
-    top = labels[:5]
+    return _decide_bin_from_labels(_top_labels_key(labels), jurisdiction_id)
 
-    if not labels:
-        res = Result(
-            bin="UNKNOWN",
-            bin_label="Not sure yet",
-            confidence="LOW",
-            confidence_score=0.0,
-            rationale=[RationaleItem(type="SYSTEM", text="No labels returned")],
-            top_labels=[]
-        )
-        clarification = Clarification(
-            question_id="q_try_again_01",
-            question_text="Could you retake the photo with one item and better lighting?",
-            answer_type="BOOLEAN",
-            options=[{"value": True, "label": "OK"}],
-        )
-        return res, True, clarification, None
 
-    best = labels[0]
-    rationale.append(RationaleItem(type="DETECTED_ITEM", text=f"Top match: {best.label}"))
+@lru_cache(maxsize=512)
+def _decide_bin_from_labels(
+    labels: Tuple[LabelScore, ...],
+    jurisdiction_id: str,
+) -> Tuple[Result, bool, Optional[Clarification], Optional[SpecialHandling]]:
+    top = list(labels)
 
-    # Special handling first
-    if best.label in {"battery"}:
-        special = SpecialHandling(
-            category="BATTERY",
-            instructions="Do not place in curbside bins. Take to a household hazardous waste drop-off or a retailer collection point.",
-            links=[]
-        )
-        res = Result(
-            bin="SPECIAL",
-            bin_label="Special handling",
-            confidence=_confidence_bucket(best.score),
-            confidence_score=float(best.score),
-            rationale=rationale + [RationaleItem(type="SAFETY", text="Batteries require special disposal")],
-            top_labels=top
-        )
-        return res, False, None, special
+    if not labels:
+        res = _make_result("UNKNOWN", "Not sure yet", 0.0, [_RI_NO_LABELS], [])
+        return res, True, _CLARIF_TRY_AGAIN, None
 
-    # Clear organics
-    if best.label in {"banana peel", "food"}:
-        res = Result(
-            bin="GREEN",
-            bin_label="Organics",
-            confidence=_confidence_bucket(best.score),
-            confidence_score=float(best.score),
-            rationale=rationale + [RationaleItem(type="RULE", text="Food and food scraps go in organics")],
-            top_labels=top
-        )
-        return res, False, None, None
-
-    # Clear recycling
-    if best.label in {"plastic bottle", "aluminum can", "glass bottle"}:
-        res = Result(
-            bin="BLUE",
-            bin_label="Recycling",
-            confidence=_confidence_bucket(best.score),
-            confidence_score=float(best.score),
-            rationale=rationale + [RationaleItem(type="RULE", text="Rigid containers like bottles/cans typically go in recycling")],
-            top_labels=top
-        )
-        return res, False, None, None
-
-    # Likely trash: plastic film/bags are commonly trash curbside
-    if best.label in {"plastic bag"}:
-        res = Result(
-            bin="GRAY",
-            bin_label="Landfill (Trash)",
-            confidence=_confidence_bucket(best.score),
-            confidence_score=float(best.score),
-            rationale=rationale + [RationaleItem(type="RULE", text="Plastic film/bags are usually not accepted in curbside recycling")],
-            top_labels=top
-        )
-        return res, False, None, None
-
-    # Ambiguous: paper box could be blue if clean, green/gray if food-soiled
-    if best.label in {"paper box"}:
-        clarification = Clarification(
-            question_id="q_food_soiled_01",
-            question_text="Is it food-soiled (grease/food residue)?",
-            answer_type="BOOLEAN",
-            options=[{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
-        )
-        res = Result(
-            bin="UNKNOWN",
-            bin_label="Not sure yet",
-            confidence=_confidence_bucket(best.score),
-            confidence_score=float(best.score),
-            rationale=rationale + [RationaleItem(type="RULE", text="Paper can be recycling if clean; organics/trash if food-soiled")],
-            top_labels=top
-        )
-        return res, True, clarification, None
+    best = labels[0]
+    rationale: List[RationaleItem] = [RationaleItem(type="DETECTED_ITEM", text=f"Top match: {best.label}")]
+
+    match _LABEL_TO_RULE.get(best.label):
+        # Special handling first
+        case "BATTERY":
+            rationale.append(_RI_BATTERY)
+            return _make_result("SPECIAL", "Special handling", best.score, rationale, top), False, None, _SPECIAL_BATTERY
+
+        # Clear organics
+        case "ORGANIC":
+            rationale.append(_RI_ORGANIC_FOOD)
+            return _make_result("GREEN", "Organics", best.score, rationale, top), False, None, None
+
+        # Clear recycling
+        case "RECYCLABLE":
+            rationale.append(_RI_RIGID_CONTAINER)
+            return _make_result("BLUE", "Recycling", best.score, rationale, top), False, None, None
+
+        # Likely trash: plastic film/bags are commonly trash curbside
+        case "FILM":
+            rationale.append(_RI_FILM)
+            return _make_result("GRAY", "Landfill (Trash)", best.score, rationale, top), False, None, None
+
+        # Ambiguous: paper box could be blue if clean, green/gray if food-soiled
+        case "AMBIGUOUS_PAPER":
+            rationale.append(_RI_PAPER_AMBIGUOUS)
+            return _make_result("UNKNOWN", "Not sure yet", best.score, rationale, top), True, _CLARIF_FOOD_SOILED, None
 
     # Default conservative: unknown → clarification
-    clarification = Clarification(
-        question_id="q_unknown_01",
-        question_text="I'm not confident. Is the item mostly food/plant-based?",
-        answer_type="BOOLEAN",
-        options=[{"value": True, "label": "Yes"}, {"value": False, "label": "No"}]
-    )
-    res = Result(
-        bin="UNKNOWN",
-        bin_label="Not sure yet",
-        confidence=_confidence_bucket(best.score),
-        confidence_score=float(best.score),
-        rationale=rationale + [RationaleItem(type="SYSTEM", text="Falling back to clarification for safety")],
-        top_labels=top
-    )
-    return res, True, clarification, None
+    rationale.append(_RI_FALLBACK)
+    return _make_result("UNKNOWN", "Not sure yet", best.score, rationale, top), True, _CLARIF_UNKNOWN, None
 
 
 def apply_clarification(question_id: str, answer: bool, prior_top_labels: List[LabelScore]) -> Result:
     """
     Stage 1 Phase 1: Simple boolean clarification handler.
     Resolves ambiguous classifications based on user answers.
+    Memoized like decide_bin_from_profile; do not mutate the returned Result.
     """
-    base_rationale = [RationaleItem(type="USER_INPUT", text=f"Answered {question_id} = {answer}")]
-
-    if question_id == "q_food_soiled_01":
-        if answer is True:
-            return Result(
-                bin="GREEN",
-                bin_label="Organics",
-                confidence="MEDIUM",
-                confidence_score=0.70,
-                rationale=base_rationale + [RationaleItem(type="RULE", text="Food-soiled paper goes in organics (where accepted)")],
-                top_labels=prior_top_labels[:5],
-            )
-        return Result(
-            bin="BLUE",
-            bin_label="Recycling",
-            confidence="MEDIUM",
-            confidence_score=0.70,
-            rationale=base_rationale + [RationaleItem(type="RULE", text="Clean paper/cardboard typically goes in recycling")],
-            top_labels=prior_top_labels[:5],
-        )
+    return _apply_clarification(question_id, answer, _top_labels_key(prior_top_labels))
 
-    if question_id == "q_unknown_01":
-        return Result(
-            bin="GREEN" if answer else "GRAY",
-            bin_label="Organics" if answer else "Landfill (Trash)",
-            confidence="LOW",
-            confidence_score=0.55,
-            rationale=base_rationale + [RationaleItem(type="RULE", text="Heuristic decision based on your answer")],
-            top_labels=prior_top_labels[:5],
-        )
 
-    return Result(
-        bin="UNKNOWN",
-        bin_label="Not sure yet",
-        confidence="LOW",
-        confidence_score=0.0,
-        rationale=base_rationale + [RationaleItem(type="SYSTEM", text="Unknown clarification question")],
-        top_labels=prior_top_labels[:5],
+@lru_cache(maxsize=128)
+def _apply_clarification(question_id: str, answer: bool, top_labels: Tuple[LabelScore, ...]) -> Result:
+    bin_type, bin_label, score, rule_rationale = _CLARIFICATION_RULES.get(
+        (question_id, answer), _CLARIFICATION_UNKNOWN_QUESTION
     )
-
+    rationale = [RationaleItem(type="USER_INPUT", text=f"Answered {question_id} = {answer}"), rule_rationale]
+    return _make_result(bin_type, bin_label, score, rationale, list(top_labels))
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal
 
 
@@ -7,6 +9,9 @@ Confidence = Literal["HIGH", "MEDIUM", "LOW"]
 
 
 class LabelScore(BaseModel):
+    # Frozen (hashable) so label lists can key the memoized rules in rules.py
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     label: str
     score: float = Field(ge=0.0, le=1.0)
 
@@ -45,18 +50,27 @@ class ItemProfile(BaseModel):
     raw_labels: Optional[List[LabelScore]] = Field(default=None, description="Original vision model labels for debugging")
 
 
-class RationaleItem(BaseModel):
+# Slotted dataclass rather than a model: rules.py builds several per request from
+# trusted literals, and pydantic still validates/serializes it inside Result.
+@dataclass(slots=True, frozen=True)
+class RationaleItem:
     type: Literal["DETECTED_ITEM", "RULE", "USER_INPUT", "SAFETY", "SYSTEM"]
     text: str
 
 
+# Rule outputs below are memoized and shared between requests by rules.py, so they
+# are frozen to make accidental mutation of a cached instance an error.
 class SpecialHandling(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     category: Literal["BATTERY", "E_WASTE", "HHW", "SHARPS", "UNKNOWN"]
     instructions: str
     links: List[str] = []
 
 
 class Clarification(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     question_id: str
     question_text: str
     answer_type: Literal["BOOLEAN"]
@@ -64,6 +78,8 @@ class Clarification(BaseModel):
 
 
 class Result(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     bin: BinType
     bin_label: str
     confidence: Confidence
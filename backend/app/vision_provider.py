@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import functools
+import hashlib
+import operator
 import os
 import random
-from dataclasses import dataclass
-from typing import List, Optional
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 import httpx
 from openai import AsyncOpenAI
@@ -13,6 +18,174 @@ from pydantic import BaseModel, Field
 
 from .schemas import LabelScore, ItemProfile
 
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+try:
+    # SIMD (AVX2/SSSE3/NEON) base64; an order of magnitude faster on multi-MB images
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # fall back to the stdlib C encoder
+    from binascii import b2a_base64
+
+    def _b64encode(data: bytes) -> bytes:
+        return b2a_base64(data, newline=False)
+
+
+# Stub label pool: (label, min score, max score)
+_STUB_LABEL_POOL = (
+    ("plastic bottle", 0.70, 0.95),
+    ("paper box", 0.55, 0.90),
+    ("food", 0.40, 0.85),
+    ("banana peel", 0.55, 0.95),
+    ("battery", 0.60, 0.98),
+    ("aluminum can", 0.65, 0.95),
+    ("plastic bag", 0.55, 0.90),
+    ("glass bottle", 0.60, 0.95),
+)
+# Parallel columns of the pool, so sampling picks indices rather than row tuples
+_STUB_LABEL_NAMES, _STUB_LABEL_LO, _STUB_LABEL_HI = zip(*_STUB_LABEL_POOL)
+_STUB_LABEL_INDICES = range(len(_STUB_LABEL_NAMES))
+_STUB_LABEL_COUNTS = (2, 3)
+
+# Stub labels mapped to ItemProfile:
+# (label, material, form_factor, contamination_risk, special_handling, confidence)
+_STUB_PROFILE_POOL = (
+    ("plastic bottle", "rigid_plastic", "bottle", "low", "none", 0.85),
+    ("paper box", "paper_cardboard", "box", "unknown", "none", 0.75),
+    ("food", "organic", "unknown", "low", "none", 0.80),
+    ("banana peel", "organic", "unknown", "low", "none", 0.90),
+    ("battery", "unknown", "unknown", "low", "battery", 0.95),
+    ("aluminum can", "metal", "can", "low", "none", 0.88),
+    ("plastic bag", "film_plastic", "bag_film", "low", "none", 0.82),
+    ("glass bottle", "glass", "bottle", "low", "none", 0.87),
+)
+
+_SCORE_OF_PAIR = operator.itemgetter(0)
+
+
+def _clamp01(x: float) -> float:
+    """Clamps a model score into [0, 1]; NaN (which fails every comparison) maps to 0."""
+    return 0.0 if x != x else min(1.0, max(0.0, x))
+
+
+def _stub_seed(image_bytes: bytes) -> int:
+    """
+    Deterministic per-image seed for the stubs; CRC32 runs in C, unlike sum().
+    Only the first 2 KB are hashed, so the stubs cost the same for any image
+    size and run inline on the event loop rather than via a thread hop.
+    """
+    return zlib.crc32(image_bytes[:2048]) % 10_000
+
+
+def _sniff_mime(image_bytes: bytes) -> str:
+    """
+    Image MIME type from the payload's magic bytes, so a mislabelled upload is sent
+    with the right type and an unsupported one fails before paying for the upload.
+    """
+    head = image_bytes[:12]
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    raise ValueError("Unsupported image format; expected JPEG, PNG, WEBP or GIF")
+
+
+def _image_data_url(image_bytes: bytes, mime_type: str) -> str:
+    """
+    Builds the base64 data URL for an image. The prefix is joined to the encoded
+    bytes and decoded once, instead of decoding the payload to str and then
+    copying it again into an f-string.
+    """
+    return b"".join((b"data:", mime_type.encode("ascii"), b";base64,", _b64encode(image_bytes))).decode("ascii")
+
+
+class _ProfileCache:
+    """
+    LRU of ItemProfiles keyed by (mime_type, content digest). Only byte-identical
+    uploads hit: perceptual hashes of these photos are dominated by the background,
+    so "near-duplicate" matches can hand one item another item's bin.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, bytes], ItemProfile]" = OrderedDict()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[ItemProfile]:
+        profile = self._entries.get(key)
+        if profile is not None:
+            self._entries.move_to_end(key)
+        return profile
+
+    def put(self, key: Tuple[str, bytes], profile: ItemProfile) -> None:
+        self._entries[key] = profile
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _content_digest(image_bytes: bytes) -> bytes:
+    """Exact-content key for coalescing identical in-flight requests."""
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+
+# Below this size per-image CPU work (hashing, base64) runs inline; a thread hop
+# costs more than the work itself.
+_INLINE_WORK_MAX_BYTES = 64 * 1024
+
+
+async def _run_for_image(func: Callable[..., T], image_bytes: bytes, *args: Any) -> T:
+    """
+    Runs func(image_bytes, *args), in a worker thread for larger images so
+    millisecond-scale hashing/encoding doesn't stall other requests on the event loop.
+    """
+    if len(image_bytes) <= _INLINE_WORK_MAX_BYTES:
+        return func(image_bytes, *args)
+    return await asyncio.to_thread(func, image_bytes, *args)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client() -> AsyncOpenAI:
+    """
+    Process-wide AsyncOpenAI client, configured from the environment on first use.
+    Reusing it keeps the SDK's httpx connection pool (keep-alive, TLS sessions)
+    warm across requests instead of handshaking on every call.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        # Fail fast with clear error; caller can convert to HTTP error.
+        # (lru_cache does not cache exceptions, so this is re-checked next call.)
+        raise RuntimeError("OPENAI_API_KEY is not set")
+
+    timeout_s = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "20"))
+    max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    base_url = os.getenv("OPENAI_BASE_URL")  # optional override, e.g. proxy; supported by SDK :contentReference[oaicite:5]{index=5}
+
+    # Safe, bounded timeout. The SDK supports float or httpx.Timeout. :contentReference[oaicite:6]{index=6}
+    timeout = httpx.Timeout(timeout_s, connect=min(5.0, timeout_s), read=timeout_s, write=timeout_s, pool=min(5.0, timeout_s))
+
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
+async def close_openai_client() -> None:
+    """Closes the shared client's connection pool, if one was ever created."""
+    if _get_openai_client.cache_info().currsize:
+        await _get_openai_client().close()
+        _get_openai_client.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_model() -> str:
+    return os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # vision-capable example in SDK docs :contentReference[oaicite:4]{index=4}
+
 
 class VisionLabels(BaseModel):
     """
@@ -22,6 +195,86 @@ class VisionLabels(BaseModel):
     labels: List[LabelScore] = Field(default_factory=list)
 
 
+# Labels prompt: keep it narrow and machine-consumable.
+_LABELS_PROMPT = (
+    "You are a computer vision classifier for consumer waste items.\n"
+    "Return 2-5 short, concrete labels describing the primary item in the photo.\n"
+    "Examples of labels: 'plastic bottle', 'aluminum can', 'paper box', 'battery', 'glass bottle', 'plastic bag', 'food'.\n"
+    "Also return a confidence score for each label between 0 and 1.\n"
+    "If the photo is unclear, still return your best guess labels.\n"
+)
+
+# Profile prompt: ask for structured ItemProfile
+_PROFILE_PROMPT = (
+    "You are a computer vision classifier for consumer waste items.\n"
+    "Analyze the image and classify the waste item into a structured profile.\n\n"
+    "Material options: paper_cardboard, rigid_plastic, film_plastic, metal, glass, organic, textile, unknown\n"
+    "Form factor options: bottle, can, box, bag_film, cup, tray, utensil, sheet, mixed, unknown\n"
+    "Contamination risk: low (clean/dry), medium (some residue), high (heavily soiled), unknown\n"
+    "Special handling: battery, e_waste, hhw (household hazardous waste), sharps, none\n\n"
+    "Provide your best classification with a confidence score between 0 and 1.\n"
+    "If uncertain about any attribute, use 'unknown' rather than guessing.\n\n"
+    "In the raw_labels field, include 2-5 descriptive labels (e.g., 'plastic bottle', 'aluminum can', 'paper box') "
+    "with confidence scores between 0 and 1. This helps with debugging and transparency.\n"
+)
+
+@functools.lru_cache(maxsize=None)
+def _get_text_format(output_type: type) -> Optional[dict]:
+    """
+    Strict structured-output format for output_type, converted once on first use
+    with the SDK's own helper (responses.parse rebuilds it on every call). The
+    helper lives in a private SDK module, so it is imported lazily and None is
+    returned if it moves; callers then fall back to responses.parse.
+    """
+    try:
+        from openai.lib._parsing._responses import type_to_text_format_param
+    except ImportError:
+        return None
+    return type_to_text_format_param(output_type)
+
+
+async def _request_structured(
+    client: AsyncOpenAI,
+    prompt: str,
+    data_url: str,
+    output_type: Type[M],
+    max_output_tokens: int,
+) -> Optional[M]:
+    """
+    Sends one prompt + image and returns the output parsed as output_type, or None
+    if the model returned no text.
+    """
+    # Responses API supports images via content array items with type input_image. :contentReference[oaicite:7]{index=7}
+    request = dict(
+        model=_get_openai_model(),
+        input=[
+            {
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": prompt},
+                    {"type": "input_image", "image_url": data_url},
+                ],
+            }
+        ],
+        # Recommended for stateless prototypes unless you explicitly want server-side storage. :contentReference[oaicite:9]{index=9}
+        store=False,
+        # Keep response small and bounded
+        max_output_tokens=max_output_tokens,
+    )
+
+    text_format = _get_text_format(output_type)
+    if text_format is None:
+        # Structured outputs: responses.parse + text_format (Pydantic). :contentReference[oaicite:8]{index=8}
+        resp = await client.responses.parse(text_format=output_type, **request)
+        return getattr(resp, "output_parsed", None)
+
+    # responses.create + model_validate_json: the output text is parsed and validated
+    # in one pass by pydantic-core, without the SDK's parsed-response copy.
+    resp = await client.responses.create(text={"format": text_format}, **request)
+    output_text = resp.output_text
+    return output_type.model_validate_json(output_text) if output_text else None
+
+
 @dataclass
 class VisionProvider:
     """
@@ -32,6 +285,20 @@ class VisionProvider:
       - "openai": real OpenAI vision API calls
     """
     mode: str = "stub"
+    # Exact-content profile cache (openai mode only); 0 disables it.
+    cache_size: int = 0
+    # Profiles below this confidence are not cached, so a poor answer is retried.
+    cache_min_confidence: float = 0.6
+    # Maximum concurrent OpenAI calls per detect_item_profile_batch.
+    batch_concurrency: int = 8
+    _profile_cache: Optional[_ProfileCache] = field(default=None, init=False, repr=False)
+    # OpenAI lookups currently running, keyed by (mime_type, content digest), so
+    # concurrent uploads of the same image share one call.
+    _inflight: Dict[Tuple[str, bytes], "asyncio.Task[ItemProfile]"] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.mode == "openai" and self.cache_size > 0:
+            self._profile_cache = _ProfileCache(self.cache_size)
 
     async def detect_labels(self, image_bytes: bytes, mime_type: str = "image/jpeg") -> List[LabelScore]:
         """
@@ -47,132 +314,116 @@ class VisionProvider:
         Main method: returns ItemProfile using structured outputs from OpenAI.
         """
         if self.mode == "openai":
-            return await self._detect_item_profile_openai(image_bytes=image_bytes, mime_type=mime_type)
+            return await self._detect_item_profile_coalesced(image_bytes=image_bytes, mime_type=mime_type)
         return self._detect_item_profile_stub(image_bytes=image_bytes)
 
+    async def detect_item_profile_batch(self, images: List[bytes], mime_type: str = "image/jpeg") -> List[ItemProfile]:
+        """
+        Returns one ItemProfile per image, in input order.
+        OpenAI calls are issued concurrently rather than one after another, at most
+        batch_concurrency at a time so large batches don't trip rate limits;
+        the stub runs inline.
+        """
+        if self.mode == "openai":
+            limit = asyncio.Semaphore(max(1, self.batch_concurrency))
+
+            async def bounded(image_bytes: bytes) -> ItemProfile:
+                async with limit:
+                    return await self._detect_item_profile_coalesced(image_bytes=image_bytes, mime_type=mime_type)
+
+            return list(await asyncio.gather(*(bounded(b) for b in images)))
+        return [self._detect_item_profile_stub(image_bytes=b) for b in images]
+
+    async def _detect_item_profile_coalesced(self, image_bytes: bytes, mime_type: str) -> ItemProfile:
+        """
+        Single-flight wrapper: identical images requested while a lookup is running
+        await that lookup instead of starting another. The lookup runs as its own
+        task and is shielded, so one caller disconnecting doesn't cancel it for the others.
+        """
+        mime_type = _sniff_mime(image_bytes)
+        key = (mime_type, await _run_for_image(_content_digest, image_bytes))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._detect_item_profile_cached(image_bytes=image_bytes, mime_type=mime_type, key=key))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._inflight_done, key))
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key: Tuple[str, bytes], task: "asyncio.Task[ItemProfile]") -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved in case every waiter was cancelled
+
+    async def _detect_item_profile_cached(self, image_bytes: bytes, mime_type: str, key: Tuple[str, bytes]) -> ItemProfile:
+        """
+        OpenAI profile lookup behind the exact-content cache. Cached profiles are
+        shared between requests and must not be mutated.
+        """
+        cache = self._profile_cache
+        if cache is None:
+            return await self._detect_item_profile_openai(image_bytes=image_bytes, mime_type=mime_type)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        profile = await self._detect_item_profile_openai(image_bytes=image_bytes, mime_type=mime_type)
+        if profile.confidence >= self.cache_min_confidence:
+            cache.put(key, profile)
+        return profile
+
     def _detect_labels_stub(self, image_bytes: bytes) -> List[LabelScore]:
         # Deterministic-ish behavior for testing:
-        seed = sum(image_bytes[:2048]) % 10_000 if image_bytes else 0
+        seed = _stub_seed(image_bytes)
         rng = random.Random(seed)
 
-        label_pool = [
-            ("plastic bottle", 0.70, 0.95),
-            ("paper box", 0.55, 0.90),
-            ("food", 0.40, 0.85),
-            ("banana peel", 0.55, 0.95),
-            ("battery", 0.60, 0.98),
-            ("aluminum can", 0.65, 0.95),
-            ("plastic bag", 0.55, 0.90),
-            ("glass bottle", 0.60, 0.95),
+        k = rng.choice(_STUB_LABEL_COUNTS)
+        # Sort plain (score, label) pairs, then build the models in final order;
+        # scores come from the pool's [0, 1] ranges, so skip validation.
+        scored = [
+            (rng.uniform(_STUB_LABEL_LO[i], _STUB_LABEL_HI[i]), _STUB_LABEL_NAMES[i])
+            for i in rng.sample(_STUB_LABEL_INDICES, k=k)
         ]
-
-        k = rng.choice([2, 3])
-        choices = rng.sample(label_pool, k=k)
-        labels = [LabelScore(label=name, score=rng.uniform(lo, hi)) for (name, lo, hi) in choices]
-        labels.sort(key=lambda x: x.score, reverse=True)
-        return labels
+        scored.sort(reverse=True)
+        return [LabelScore.model_construct(label=name, score=score) for score, name in scored]
 
     async def _detect_labels_openai(self, image_bytes: bytes, mime_type: str) -> List[LabelScore]:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            # Fail fast with clear error; caller can convert to HTTP error.
-            raise RuntimeError("OPENAI_API_KEY is not set")
-
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # vision-capable example in SDK docs :contentReference[oaicite:4]{index=4}
-        timeout_s = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "20"))
-        max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
-        base_url = os.getenv("OPENAI_BASE_URL")  # optional override, e.g. proxy; supported by SDK :contentReference[oaicite:5]{index=5}
-
-        # Safe, bounded timeout. The SDK supports float or httpx.Timeout. :contentReference[oaicite:6]{index=6}
-        timeout = httpx.Timeout(timeout_s, connect=min(5.0, timeout_s), read=timeout_s, write=timeout_s, pool=min(5.0, timeout_s))
-
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            timeout=timeout,
-            max_retries=max_retries,
-        )
-
-        b64 = base64.b64encode(image_bytes).decode("utf-8")
-        data_url = f"data:{mime_type};base64,{b64}"
-
-        # Prompt: keep it narrow and machine-consumable.
-        prompt = (
-            "You are a computer vision classifier for consumer waste items.\n"
-            "Return 2-5 short, concrete labels describing the primary item in the photo.\n"
-            "Examples of labels: 'plastic bottle', 'aluminum can', 'paper box', 'battery', 'glass bottle', 'plastic bag', 'food'.\n"
-            "Also return a confidence score for each label between 0 and 1.\n"
-            "If the photo is unclear, still return your best guess labels.\n"
-        )
-
-        # Responses API supports images via content array items with type input_image. :contentReference[oaicite:7]{index=7}
-        # Structured outputs: responses.parse + text_format (Pydantic). :contentReference[oaicite:8]{index=8}
-        resp = await client.responses.parse(
-            model=model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": prompt},
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
-            text_format=VisionLabels,
-            # Recommended for stateless prototypes unless you explicitly want server-side storage. :contentReference[oaicite:9]{index=9}
-            store=False,
-            # Keep response small and bounded
-            max_output_tokens=300,
-        )
+        mime_type = _sniff_mime(image_bytes)
+        client = _get_openai_client()
 
-        parsed: Optional[VisionLabels] = getattr(resp, "output_parsed", None)
+        data_url = await _run_for_image(_image_data_url, image_bytes, mime_type)
+        parsed = await _request_structured(client, _LABELS_PROMPT, data_url, VisionLabels, max_output_tokens=300)
         if not parsed or not parsed.labels:
             # Fallback: empty list, caller will handle.
             return []
 
-        # Normalize: cap scores into [0,1] and sort desc
-        cleaned = []
-        for ls in parsed.labels:
-            score = float(ls.score)
-            if score < 0.0:
-                score = 0.0
-            if score > 1.0:
-                score = 1.0
-            cleaned.append(LabelScore(label=ls.label.strip().lower(), score=score))
-
-        cleaned.sort(key=lambda x: x.score, reverse=True)
-        return cleaned
+        # Normalize: cap scores into [0,1] and sort desc as plain (score, label) pairs,
+        # then build the models in final order. Values are already typed by the
+        # structured-output parse, so skip re-validation. Sorting on the score alone
+        # keeps equal scores in the model's order.
+        pairs = [(_clamp01(float(ls.score)), ls.label.strip().lower()) for ls in parsed.labels]
+        pairs.sort(key=_SCORE_OF_PAIR, reverse=True)
+        return [LabelScore.model_construct(label=label, score=score) for score, label in pairs]
 
     def _detect_item_profile_stub(self, image_bytes: bytes) -> ItemProfile:
         """
         Stub implementation that returns ItemProfile for testing.
         """
         # Deterministic-ish behavior for testing:
-        seed = sum(image_bytes[:2048]) % 10_000 if image_bytes else 0
+        seed = _stub_seed(image_bytes)
         rng = random.Random(seed)
 
-        # Map stub labels to ItemProfile
-        label_pool = [
-            ("plastic bottle", "rigid_plastic", "bottle", "low", "none", 0.85),
-            ("paper box", "paper_cardboard", "box", "unknown", "none", 0.75),
-            ("food", "organic", "unknown", "low", "none", 0.80),
-            ("banana peel", "organic", "unknown", "low", "none", 0.90),
-            ("battery", "unknown", "unknown", "low", "battery", 0.95),
-            ("aluminum can", "metal", "can", "low", "none", 0.88),
-            ("plastic bag", "film_plastic", "bag_film", "low", "none", 0.82),
-            ("glass bottle", "glass", "bottle", "low", "none", 0.87),
-        ]
-
-        choice = rng.choice(label_pool)
+        choice = rng.choice(_STUB_PROFILE_POOL)
         label_name, material, form_factor, contamination, special, confidence = choice
 
-        # Generate some raw labels for debugging
+        # Generate some raw labels for debugging. Every value comes from the pool
+        # or a [0.3, 0.5] draw, so skip validation.
         raw_labels = [
-            LabelScore(label=label_name, score=confidence),
-            LabelScore(label="other item", score=rng.uniform(0.3, 0.5)),
+            LabelScore.model_construct(label=label_name, score=confidence),
+            LabelScore.model_construct(label="other item", score=rng.uniform(0.3, 0.5)),
         ]
 
-        return ItemProfile(
+        return ItemProfile.model_construct(
             material=material,
             form_factor=form_factor,
             contamination_risk=contamination,
@@ -185,61 +436,13 @@ class VisionProvider:
         """
         Uses OpenAI structured outputs to directly return ItemProfile.
         """
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY is not set")
-
-        model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        timeout_s = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "20"))
-        max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
-        base_url = os.getenv("OPENAI_BASE_URL")
-
-        timeout = httpx.Timeout(timeout_s, connect=min(5.0, timeout_s), read=timeout_s, write=timeout_s, pool=min(5.0, timeout_s))
-
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            timeout=timeout,
-            max_retries=max_retries,
-        )
-
-        b64 = base64.b64encode(image_bytes).decode("utf-8")
-        data_url = f"data:{mime_type};base64,{b64}"
-
-        # Prompt: ask for structured ItemProfile
-        prompt = (
-            "You are a computer vision classifier for consumer waste items.\n"
-            "Analyze the image and classify the waste item into a structured profile.\n\n"
-            "Material options: paper_cardboard, rigid_plastic, film_plastic, metal, glass, organic, textile, unknown\n"
-            "Form factor options: bottle, can, box, bag_film, cup, tray, utensil, sheet, mixed, unknown\n"
-            "Contamination risk: low (clean/dry), medium (some residue), high (heavily soiled), unknown\n"
-            "Special handling: battery, e_waste, hhw (household hazardous waste), sharps, none\n\n"
-            "Provide your best classification with a confidence score between 0 and 1.\n"
-            "If uncertain about any attribute, use 'unknown' rather than guessing.\n\n"
-            "In the raw_labels field, include 2-5 descriptive labels (e.g., 'plastic bottle', 'aluminum can', 'paper box') "
-            "with confidence scores between 0 and 1. This helps with debugging and transparency.\n"
-        )
-
-        resp = await client.responses.parse(
-            model=model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": prompt},
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
-            text_format=ItemProfile,
-            store=False,
-            max_output_tokens=500,
-        )
+        client = _get_openai_client()
 
-        parsed: Optional[ItemProfile] = getattr(resp, "output_parsed", None)
+        data_url = await _run_for_image(_image_data_url, image_bytes, mime_type)
+        parsed = await _request_structured(client, _PROFILE_PROMPT, data_url, ItemProfile, max_output_tokens=500)
         if not parsed:
             # Fallback: return unknown profile
-            return ItemProfile(
+            return ItemProfile.model_construct(
                 material="unknown",
                 form_factor="unknown",
                 contamination_risk="unknown",
@@ -249,14 +452,18 @@ class VisionProvider:
             )
 
         # Normalize confidence to [0,1]
-        if parsed.confidence < 0.0:
-            parsed.confidence = 0.0
-        if parsed.confidence > 1.0:
-            parsed.confidence = 1.0
+        parsed.confidence = _clamp01(parsed.confidence)
 
         return parsed
 
 
+@functools.lru_cache(maxsize=1)
 def get_provider() -> VisionProvider:
+    """Returns the process-wide provider; VISION_* settings are read once."""
     mode = os.getenv("VISION_PROVIDER", "stub").strip().lower()
-    return VisionProvider(mode=mode)
+    return VisionProvider(
+        mode=mode,
+        cache_size=int(os.getenv("VISION_CACHE_SIZE", "0")),
+        cache_min_confidence=float(os.getenv("VISION_CACHE_MIN_CONFIDENCE", "0.6")),
+        batch_concurrency=int(os.getenv("VISION_BATCH_CONCURRENCY", "8")),
+    )